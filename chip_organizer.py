@@ -2,32 +2,66 @@
 Main application window for the Chip Organizer.
 """
 
+import hashlib
 import os
-import json
 import shutil
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from collections import Counter, OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Dict, Set
+from typing import Iterable, List, Optional, Dict, Set, Tuple
 from PyQt5.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QFileDialog, QMessageBox, QListWidget, QSplitter,
     QGroupBox, QCheckBox, QScrollArea, QInputDialog, QListWidgetItem,
-    QGridLayout, QFrame, QShortcut
+    QGridLayout, QFrame, QShortcut, QListView, QProgressDialog
 )
-from PyQt5.QtCore import Qt, QSettings, QSize
-from PyQt5.QtGui import QPixmap, QImage, QColor, QBrush, QKeySequence
+from PyQt5.QtCore import Qt, QSettings, QStandardPaths, QSize, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QPixmap, QImage, QImageReader, QColor, QBrush, QFont, QKeySequence
 from dialogs import RemoveLabelDialog, AddLabelDialog
-from utils import find_image_files, parse_labels_from_text, get_categories_from_ontology, format_category_label
+from session_store import SessionStore
+from utils import (
+    find_image_files, parse_labels_from_text, get_categories_from_ontology, format_category_label,
+    dump_json, load_json, get_mtime_ns, image_names_match, link_or_copy, move_file
+)
 from constants import (
     SUPPORTED_FORMATS, APP_NAME, APP_DISPLAY_NAME, 
     MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT, FILE_LIST_MAX_WIDTH,
-    COLOR_LABELED, COLOR_UNLABELED, COLOR_CURRENT
+    COLOR_LABELED, COLOR_UNLABELED, COLOR_CURRENT, COLOR_PLACEHOLDER, SCALED_PIXMAP_CACHE_SIZE,
+    EXPORT_MAX_WORKERS, SESSION_DB_FILENAME, THUMBNAIL_CACHE_SIZE, THUMBNAIL_CACHE_DIRNAME,
+    THUMBNAIL_CACHE_MAX_BYTES, THUMBNAIL_TEMP_MAX_AGE_SECONDS
 )
 
+# Status indicator colors, selected through its "state" dynamic property
+STYLE_STATUS_INDICATOR = """
+    QLabel { padding: 8px; font-weight: bold; background-color: #e0e0e0; border: 2px solid #999; border-radius: 4px; }
+    QLabel[state="ready"] { background-color: #cce5ff; border: 2px solid #007bff; }
+    QLabel[state="labeled"] { color: white; background-color: #28a745; border: 2px solid #1e7e34; }
+    QLabel[state="removed"] { background-color: #ffc107; border: 2px solid #ff9800; }
+    QLabel[state="complete"] { background-color: #90EE90; border: 2px solid #4CAF50; }
+"""
+
+# Current classification display, highlighted through its "selected" dynamic property
+STYLE_CURRENT_CLASSIFICATION = """
+    QLabel { padding: 10px; background-color: #f0f0f0; border: 1px solid #ccc; }
+    QLabel[selected="true"] { background-color: #cce5ff; border: 2px solid #007bff; font-weight: bold; }
+"""
+
+# Grid image borders; labeled images normally use their category's sheet
+# from category_stylesheets and fall back to the generic labeled one
+STYLE_IMAGE_UNLABELED = "QLabel { border: 3px solid gray; }"
+STYLE_IMAGE_LABELED = "QLabel { border: 3px solid green; background-color: rgba(0, 255, 0, 0.2); }"
+
 
 class ClickableImageLabel(QLabel):
     """A clickable image label for grid view."""
     
-    def __init__(self, image_path: Path, app_instance):
+    def __init__(self, image_path: Optional[Path], app_instance):
         super().__init__()
         self.image_path = image_path
         self.app_instance = app_instance
@@ -54,6 +88,16 @@ class ClickableImageLabel(QLabel):
 
         super().mousePressEvent(event)
     
+    def rebind(self, image_path: Path, pixmap: QPixmap, category: Optional[str] = None):
+        """Show a different image in this label, reusing the widget."""
+        self.image_path = image_path
+        self.assigned_category = category
+        if pixmap.isNull():
+            self.clear()
+        else:
+            self.setPixmap(pixmap)
+        self.set_labeled(category is not None)
+    
     def set_labeled(self, labeled: bool):
         """Mark this image as labeled."""
         self.is_labeled = labeled
@@ -61,22 +105,15 @@ class ClickableImageLabel(QLabel):
     
     def update_border(self):
         """Update border color based on state."""
-        if self.is_labeled and hasattr(self, 'assigned_category') and self.assigned_category:
-            # Use category color if available
-            color_hex = None
-            try:
-                color_hex = self.app_instance.category_colors.get(self.assigned_category)
-            except Exception:
-                color_hex = None
-
-            if color_hex:
-                c = QColor(color_hex)
-                r, g, b, _ = c.getRgb()
-                self.setStyleSheet(f"QLabel {{ border: 3px solid {color_hex}; background-color: rgba({r}, {g}, {b}, 60); }}")
-            else:
-                self.setStyleSheet("QLabel { border: 3px solid green; background-color: rgba(0, 255, 0, 0.2); }")
+        if self.is_labeled and getattr(self, 'assigned_category', None):
+            # Use the category's precomputed sheet if available
+            stylesheets = getattr(self.app_instance, 'category_stylesheets', {})
+            style = stylesheets.get(self.assigned_category, STYLE_IMAGE_LABELED)
         else:
-            self.setStyleSheet("QLabel { border: 3px solid gray; }")
+            style = STYLE_IMAGE_UNLABELED
+        # Re-applying an identical sheet would still re-parse and re-polish it
+        if style != self.styleSheet():
+            self.setStyleSheet(style)
 
     def startDrag(self):
         """Helper to start a drag programmatically if needed."""
@@ -84,6 +121,198 @@ class ClickableImageLabel(QLabel):
         return
 
 
+def intern_categories(classifications: Dict[str, str]) -> Dict[str, str]:
+    """
+    Return a copy of a filename -> category mapping with interned categories.
+    
+    Decoded JSON and SQLite rows produce a separate string for every file;
+    interning leaves one shared object per category.
+    """
+    return {filename: sys.intern(category) for filename, category in classifications.items()}
+
+
+def scale_image(image: QImage, size: int, smooth: bool = True) -> QImage:
+    """
+    Scale an image to fit a size x size box.
+    
+    Smooth downscaling first reduces images more than twice the target size
+    with a cheap nearest-neighbour pass to twice the target, so the smooth
+    filter only runs over about four times the output pixels instead of the
+    whole source.
+    """
+    if not smooth:
+        return image.scaled(size, size, Qt.KeepAspectRatio, Qt.FastTransformation)
+    if max(image.width(), image.height()) > 2 * size:
+        image = image.scaled(2 * size, 2 * size, Qt.KeepAspectRatio, Qt.FastTransformation)
+    return image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def load_scaled_image(image_path: str, size: int, smooth: bool = True) -> QImage:
+    """
+    Decode an image at the size needed to fit a size x size box.
+    
+    JPEGs are scaled during decode (libjpeg's DCT scaling through
+    QImageReader.setScaledSize), so large sources never materialize at full
+    resolution. Other formats can't scale while decoding; they are decoded in
+    full and then scaled with scale_image (nearest-neighbour only with
+    smooth=False, for quick previews). EXIF orientation is applied, so rotated
+    camera images are shown upright. Safe to call from worker threads.
+    """
+    reader = QImageReader(image_path)
+    reader.setAutoTransform(True)
+    original_size = reader.size()
+    if original_size.isValid() and bytes(reader.format()) in (b'jpeg', b'jpg'):
+        reader.setScaledSize(original_size.scaled(size, size, Qt.KeepAspectRatio))
+        image = reader.read()
+        if not image.isNull():
+            return image
+        # Retry with a fresh reader and no scaling below
+        reader = QImageReader(image_path)
+        reader.setAutoTransform(True)
+    
+    image = reader.read()
+    if image.isNull():
+        return image
+    return scale_image(image, size, smooth)
+
+
+def thumbnail_cache_file(cache_dir: str, image_path: str) -> Optional[str]:
+    """Path of the cached thumbnail for an image's current contents (None if it can't be stat'ed)."""
+    try:
+        mtime_ns = os.stat(image_path).st_mtime_ns
+    except OSError:
+        return None
+    key = f"{image_path}|{mtime_ns}".encode('utf-8', 'surrogateescape')
+    return os.path.join(cache_dir, f"{hashlib.sha1(key).hexdigest()}.png")
+
+
+def load_thumbnail(image_path: str, size: int, cache_dir: Optional[str], smooth: bool = True) -> QImage:
+    """
+    Like load_scaled_image, but served from the on-disk thumbnail cache when possible.
+    
+    Sizes up to THUMBNAIL_CACHE_SIZE are scaled down from a cached thumbnail of
+    that size, so revisiting a large source (in this or a later session) reads a
+    small PNG instead. Missing thumbnails are created by smooth loads only (grid
+    thumbnails on worker threads, category example previews on the GUI thread).
+    Larger sizes, and sources no bigger than a thumbnail, bypass the cache. Safe
+    to call from worker threads.
+    """
+    if cache_dir is None or size > THUMBNAIL_CACHE_SIZE:
+        return load_scaled_image(image_path, size, smooth)
+    cache_file = thumbnail_cache_file(cache_dir, image_path)
+    if cache_file is None:
+        return load_scaled_image(image_path, size, smooth)
+    
+    thumbnail = QImage(cache_file)
+    if thumbnail.isNull():
+        original_size = QImageReader(image_path).size()
+        if not smooth or max(original_size.width(), original_size.height()) <= THUMBNAIL_CACHE_SIZE:
+            return load_scaled_image(image_path, size, smooth)
+        thumbnail = load_scaled_image(image_path, THUMBNAIL_CACHE_SIZE)
+        if thumbnail.isNull():
+            return thumbnail
+        # Write under a per-thread name and rename, so readers never see a partial file
+        temp_file = f"{cache_file}.{threading.get_ident()}.tmp"
+        try:
+            if not thumbnail.save(temp_file, "PNG"):
+                raise OSError("thumbnail not written")
+            os.replace(temp_file, cache_file)
+        except OSError:
+            # Don't leave a partial file behind; the thumbnail is simply not cached
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+    
+    return scale_image(thumbnail, size, smooth)
+
+
+def prune_thumbnail_cache(cache_dir: str, max_bytes: int):
+    """
+    Delete the least recently used cached thumbnails until the cache fits in max_bytes.
+    
+    Thumbnails are keyed by source path and mtime, so edited, renamed or moved
+    sources leave orphaned files that are only reclaimed here. Recency is the
+    later of the access and modification times, since many filesystems don't
+    update access times. Temporary files left by interrupted writes are deleted
+    once they are older than THUMBNAIL_TEMP_MAX_AGE_SECONDS (younger ones may
+    still be being written). Safe to call from worker threads.
+    """
+    thumbnails = []
+    total_bytes = 0
+    stale_before = time.time() - THUMBNAIL_TEMP_MAX_AGE_SECONDS
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                is_temp = entry.name.endswith('.tmp')
+                if not is_temp and not entry.name.endswith('.png'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if is_temp:
+                    if stat.st_mtime < stale_before:
+                        try:
+                            os.remove(entry.path)
+                        except OSError:
+                            pass
+                    continue
+                thumbnails.append((max(stat.st_atime, stat.st_mtime), stat.st_size, entry.path))
+                total_bytes += stat.st_size
+    except OSError:
+        return
+    if total_bytes <= max_bytes:
+        return
+    
+    thumbnails.sort()
+    for _, file_size, path in thumbnails:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_bytes -= file_size
+        if total_bytes <= max_bytes:
+            break
+
+
+class ThumbnailCachePruner(QRunnable):
+    """Run prune_thumbnail_cache on a worker thread."""
+    
+    def __init__(self, cache_dir: str, max_bytes: int):
+        super().__init__()
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+    
+    def run(self):
+        prune_thumbnail_cache(self.cache_dir, self.max_bytes)
+
+
+class PixmapLoaderSignals(QObject):
+    """Signals emitted by PixmapLoader (QRunnable cannot define signals itself)."""
+    
+    loaded = pyqtSignal(str, int, QImage)
+
+
+class PixmapLoader(QRunnable):
+    """Decode a scaled image on a worker thread.
+    
+    Only QImage is safe to use off the GUI thread, so the decoded image is handed
+    back through a signal and converted to a QPixmap on the main thread.
+    """
+    
+    def __init__(self, image_path: str, size: int, cache_dir: Optional[str] = None):
+        super().__init__()
+        self.image_path = image_path
+        self.size = size
+        self.cache_dir = cache_dir
+        self.signals = PixmapLoaderSignals()
+    
+    def run(self):
+        image = load_thumbnail(self.image_path, self.size, self.cache_dir)
+        self.signals.loaded.emit(self.image_path, self.size, image)
+
+
 class ChipOrganizerApp(QMainWindow):
     """Main application window for organizing chip images."""
     
@@ -93,34 +322,95 @@ class ChipOrganizerApp(QMainWindow):
         self.setMinimumSize(MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT)
         
         # Application state
-        self.image_files: List[Path] = []
+        self.image_files: Tuple[Path, ...] = ()
         self.current_index: int = 0
         self.ontology: Dict = {}
+        self._categories_cache: Optional[List] = None  # Derived from ontology, see `categories`
         self.classifications: Dict[str, str] = {}  # filename -> category
+        self._category_counts: Dict[str, int] = {}  # category -> number of classified files
         self.source_directory: Optional[Path] = None
+        # Result of the last directory scan (image_files shrinks as pages are cycled)
+        # and the directory mtime it was taken at, both saved with progress. Both
+        # lists are immutable tuples, so image_files can share the scan result
+        self._source_files: Tuple[Path, ...] = ()
+        self._source_mtime_ns: Optional[int] = None
+        # image_files in case-insensitive name order for cycling; sorted once per
+        # image list and pruned as pages are cycled (None until first needed)
+        self._cycle_order: Optional[List[Path]] = None
         
         # Grid state
         self.grid_size: tuple = (8, 4)  # columns x rows (configurable)
         self.grid_start_index: int = 0
         self.grid_labels: Dict[ClickableImageLabel, Path] = {}
+        # Pooled grid cells, rebuilt only when the grid size changes, plus the
+        # grid size and zoom level they were laid out for
+        self._grid_cells: List[ClickableImageLabel] = []
+        self._grid_cells_size: Optional[tuple] = None
+        self._grid_cells_zoom: Optional[float] = None
+        # Filename -> file list row, so a single label change only touches its own row
+        self._file_list_items: Dict[str, QListWidgetItem] = {}
+        self._labeled_brush = QBrush(QColor(*COLOR_LABELED))
+        self._unlabeled_brush = QBrush(QColor(*COLOR_UNLABELED))
+        # Deferred UI refresh state (see _schedule_refresh)
+        self._refresh_pending: bool = False
+        self._dirty_file_list_items: Set[str] = set()
+        self._removed_file_list_items: Set[str] = set()
+        self._redisplay_pending: bool = False  # see _schedule_redisplay
         self.current_category: Optional[str] = None  # Currently selected category for labeling
         self.zoom_level: float = 1.0  # Zoom level (1.0 = 100%)
         # Category -> hex color mapping for labeled borders
         self.category_colors: Dict[str, str] = {}
+        # Category -> grid border stylesheet and category list background,
+        # built alongside category_colors
+        self.category_stylesheets: Dict[str, str] = {}
+        self._category_brushes: Dict[str, QBrush] = {}
         # Category -> example image path mapping (may be empty if examples disabled)
         self.category_examples: Dict[str, Path] = {}
         # State for interactive "set example" flow
         self.awaiting_example_selection: bool = False
         self.pending_example_category: Optional[str] = None
         
+        # Scaled thumbnails in a small LRU keyed by (path, size) so revisits skip decoding
+        self._scaled_pixmaps: "OrderedDict[Tuple[str, int], QPixmap]" = OrderedDict()
+        # Background decoding of grid thumbnails (the visible page first, then the
+        # next one so cycling hits a warm cache) on a dedicated pool. Requests wait
+        # in _pending_loads and are handed to the pool one free worker at a time
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_in_flight: Set[Tuple[str, int]] = set()
+        self._pending_loads: List[Path] = []
+        self._pending_load_size: int = 0
+        # Shown in every grid cell whose thumbnail is still loading (see _placeholder_pixmap)
+        self._placeholder: Optional[QPixmap] = None
+        # Small thumbnails persisted across sessions (None if the cache location
+        # is unavailable, in which case images are always decoded from source)
+        thumbnail_dir = (Path(QStandardPaths.writableLocation(QStandardPaths.CacheLocation))
+                         / THUMBNAIL_CACHE_DIRNAME)
+        try:
+            thumbnail_dir.mkdir(parents=True, exist_ok=True)
+            self._thumbnail_dir: Optional[str] = str(thumbnail_dir)
+        except OSError:
+            self._thumbnail_dir = None
+        else:
+            # Keep the cache bounded; runs alongside the first thumbnail loads
+            self._prefetch_pool.start(ThumbnailCachePruner(self._thumbnail_dir, THUMBNAIL_CACHE_MAX_BYTES))
+        
         # Settings
         self.settings = QSettings(APP_NAME, APP_NAME)
         
+        # Label journal used to restore the last session; labeling still works
+        # without it if the database cannot be opened
+        try:
+            data_dir = Path(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation))
+            self.session_store: Optional[SessionStore] = SessionStore(data_dir / SESSION_DB_FILENAME)
+        except (sqlite3.Error, OSError):
+            self.session_store = None
+        
         # Setup UI
         self.setup_ui()
         
-        # Restore last session if available
-        self.restore_session()
+        # Restore last session if available, once the window is up; scanning a
+        # large (or network) directory would otherwise delay the first paint
+        QTimer.singleShot(0, self.restore_session)
     
     def setup_ui(self):
         """Initialize the user interface."""
@@ -163,6 +453,16 @@ class ChipOrganizerApp(QMainWindow):
         self.copy_mode_checkbox.setToolTip("Copy files (uncheck to move files)")
         toolbar_layout.addWidget(self.copy_mode_checkbox)
         
+        self.hard_link_checkbox = QCheckBox("Hard links")
+        self.hard_link_checkbox.setChecked(False)
+        self.hard_link_checkbox.setToolTip(
+            "Export copies as hard links when on the same drive (no data is duplicated; "
+            "the exported file shares contents with the original). Elsewhere files are "
+            "cloned where the filesystem supports it, otherwise copied"
+        )
+        self.copy_mode_checkbox.toggled.connect(self.hard_link_checkbox.setEnabled)
+        toolbar_layout.addWidget(self.hard_link_checkbox)
+        
         # Grid dimension settings
         grid_size_label = QLabel("Grid:")
         toolbar_layout.addWidget(grid_size_label)
@@ -190,6 +490,10 @@ class ChipOrganizerApp(QMainWindow):
         self.file_list = QListWidget()
         self.file_list.itemClicked.connect(self.on_file_list_clicked)
         self.file_list.setMaximumWidth(FILE_LIST_MAX_WIDTH)
+        # Rows are single-line text: skip per-item size hints and lay out in batches
+        self.file_list.setUniformItemSizes(True)
+        self.file_list.setLayoutMode(QListView.Batched)
+        self.file_list.setBatchSize(100)
         left_layout.addWidget(self.file_list)
         
         splitter.addWidget(left_widget)
@@ -246,9 +550,7 @@ class ChipOrganizerApp(QMainWindow):
         # Classification status indicator
         self.status_indicator = QLabel("Status: Select a category from the right panel, then click images to label them")
         self.status_indicator.setAlignment(Qt.AlignCenter)
-        self.status_indicator.setStyleSheet(
-            "QLabel { padding: 8px; font-weight: bold; background-color: #e0e0e0; border: 2px solid #999; border-radius: 4px; }"
-        )
+        self.status_indicator.setStyleSheet(STYLE_STATUS_INDICATOR)
         center_layout.addWidget(self.status_indicator)
         
         splitter.addWidget(center_widget)
@@ -316,9 +618,7 @@ class ChipOrganizerApp(QMainWindow):
         
         # Current classification display
         self.current_classification_label = QLabel("Current: Not classified")
-        self.current_classification_label.setStyleSheet(
-            "QLabel { padding: 10px; background-color: #f0f0f0; border: 1px solid #ccc; }"
-        )
+        self.current_classification_label.setStyleSheet(STYLE_CURRENT_CLASSIFICATION)
         ontology_layout.addWidget(self.current_classification_label)
         
         # Category example preview
@@ -362,38 +662,111 @@ class ChipOrganizerApp(QMainWindow):
 
         self.update_ui_state()
     
+    @property
+    def categories(self) -> List:
+        """Categories of the current ontology (cached until the ontology changes)."""
+        if self._categories_cache is None:
+            self._categories_cache = get_categories_from_ontology(self.ontology)
+        return self._categories_cache
+    
+    def invalidate_categories(self):
+        """Drop the cached category list; call after any ontology change."""
+        self._categories_cache = None
+    
+    def set_widget_state(self, widget: QWidget, name: str, value):
+        """Set a dynamic property used by a widget's stylesheet and restyle it.
+        
+        The stylesheet is parsed once in setup_ui; switching a property only
+        re-polishes the widget, and does nothing if the value is unchanged.
+        """
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+    
     def on_file_list_clicked(self, item):
         """Handle clicking on a file in the file list."""
         # In grid-only mode, file list is informational only
         pass
     
     def update_file_list(self):
-        """Update the file list with current images and their status."""
+        """Rebuild the file list with current images and their status."""
+        self.file_list.setUpdatesEnabled(False)
+        self.file_list.blockSignals(True)
         self.file_list.clear()
+        self._file_list_items.clear()
         
-        for i, image_file in enumerate(self.image_files):
+        for image_file in self.image_files:
             filename = image_file.name
-            is_labeled = filename in self.classifications
-            
-            # Create list item with indicator
-            if is_labeled:
-                category = self.classifications[filename]
-                item_text = f"✓ {filename}"
-                self.file_list.addItem(item_text)
-                # Get the actual item that was just added
-                list_item = self.file_list.item(self.file_list.count() - 1)
-                list_item.setBackground(QBrush(QColor(*COLOR_LABELED)))
-                list_item.setToolTip(f"Labeled: {category}")
-            else:
-                item_text = f"⚠ {filename}"
-                self.file_list.addItem(item_text)
-                list_item = self.file_list.item(self.file_list.count() - 1)
-                list_item.setBackground(QBrush(QColor(*COLOR_UNLABELED)))
-                list_item.setToolTip("Not labeled")
+            # Style the item before it's added so the view lays it out once
+            list_item = QListWidgetItem()
+            self._style_file_list_item(list_item, filename)
+            self.file_list.addItem(list_item)
+            self._file_list_items[filename] = list_item
         
         # Highlight current image
         if 0 <= self.current_index < self.file_list.count():
             self.file_list.setCurrentRow(self.current_index)
+        self.file_list.blockSignals(False)
+        self.file_list.setUpdatesEnabled(True)
+    
+    def refresh_file_list_item(self, filename: str):
+        """Update a single file list row after its label changed."""
+        list_item = self._file_list_items.get(filename)
+        if list_item is not None:
+            self._style_file_list_item(list_item, filename)
+    
+    def remove_file_list_items(self, filenames: Set[str]):
+        """Drop the rows of files that left image_files, keeping the rest of the list."""
+        self.file_list.setUpdatesEnabled(False)
+        self.file_list.blockSignals(True)
+        for filename in filenames:
+            list_item = self._file_list_items.pop(filename, None)
+            if list_item is not None:
+                self.file_list.takeItem(self.file_list.row(list_item))
+        self.file_list.blockSignals(False)
+        self.file_list.setUpdatesEnabled(True)
+    
+    def _schedule_refresh(self, *filenames: str, removed_files: Iterable[str] = ()):
+        """Queue statistics, UI state and file list updates for the next event-loop turn.
+        
+        Bursts of label clicks or page cycles then repaint these views once
+        instead of once per action.
+        
+        Args:
+            filenames: Files whose file list rows need restyling
+            removed_files: Files whose rows should be removed from the list
+        """
+        self._dirty_file_list_items.update(filenames)
+        self._removed_file_list_items.update(removed_files)
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+    
+    def _do_refresh(self):
+        """Apply the updates queued by _schedule_refresh."""
+        self._refresh_pending = False
+        if self._removed_file_list_items:
+            self.remove_file_list_items(self._removed_file_list_items)
+        for filename in self._dirty_file_list_items:
+            self.refresh_file_list_item(filename)
+        self._removed_file_list_items.clear()
+        self._dirty_file_list_items.clear()
+        self.update_statistics()
+        self.update_ui_state()
+    
+    def _style_file_list_item(self, list_item: QListWidgetItem, filename: str):
+        """Set a file list row's indicator, color and tooltip from its label."""
+        category = self.classifications.get(filename)
+        if category is not None:
+            list_item.setText(f"✓ {filename}")
+            list_item.setBackground(self._labeled_brush)
+            list_item.setToolTip(f"Labeled: {category}")
+        else:
+            list_item.setText(f"⚠ {filename}")
+            list_item.setBackground(self._unlabeled_brush)
+            list_item.setToolTip("Not labeled")
     
     def load_images(self):
         """Load images from a selected directory."""
@@ -406,8 +779,8 @@ class ChipOrganizerApp(QMainWindow):
         
         self.source_directory = Path(directory)
         
-        # Find all supported image files using utility function
-        self.image_files = find_image_files(self.source_directory, SUPPORTED_FORMATS)
+        # Find all supported image files
+        self.scan_source_directory()
         
         if not self.image_files:
             QMessageBox.warning(
@@ -418,6 +791,8 @@ class ChipOrganizerApp(QMainWindow):
         
         self.current_index = 0
         self.classifications = {}
+        self._rebuild_category_counts()
+        self._replace_session_labels()
         self.grid_start_index = 0
         
         # Display grid
@@ -432,6 +807,14 @@ class ChipOrganizerApp(QMainWindow):
             f"Loaded {len(self.image_files)} images from {directory}"
         )
     
+    def scan_source_directory(self):
+        """Find the supported images in source_directory and make them the image list."""
+        # Take the mtime first so a change during the scan invalidates the result
+        self._source_mtime_ns = get_mtime_ns(self.source_directory)
+        self._source_files = tuple(find_image_files(self.source_directory, SUPPORTED_FORMATS))
+        self.image_files = self._source_files
+        self._cycle_order = None
+    
     def load_ontology(self):
         """Load ontology from a CSV file."""
         filename, _ = QFileDialog.getOpenFileName(
@@ -444,15 +827,21 @@ class ChipOrganizerApp(QMainWindow):
         try:
             # Read CSV file - each line is a category label
             # Labels can have hierarchical structure using dash delimiter (e.g., "Mammal-carnivore-cat")
+            # Lines are read as they stream in; repeated labels keep their first position
             categories = []
+            seen = set()
             with open(filename, 'r', encoding='utf-8') as f:
                 for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):  # Skip empty lines and comments
-                        categories.append(line)
+                    label = line.strip()
+                    # Skip empty lines, comments and duplicates
+                    if label and not label.startswith('#') and label not in seen:
+                        seen.add(label)
+                        categories.append(label)
             
             # Store as simple list
             self.ontology = {'categories': categories}
+            self.invalidate_categories()
+            self._write_session_categories()
             
             # Update category list
             self.update_category_list()
@@ -474,8 +863,7 @@ class ChipOrganizerApp(QMainWindow):
         if not self.ontology:
             return
         
-        # Get categories using utility function
-        categories = get_categories_from_ontology(self.ontology)
+        categories = self.categories
         
         # Sort alphabetically if checkbox is checked
         if hasattr(self, 'sort_labels_checkbox') and self.sort_labels_checkbox.isChecked():
@@ -484,25 +872,30 @@ class ChipOrganizerApp(QMainWindow):
         for category in categories:
             # Ensure a stable color for each category (generate if missing)
             if category not in self.category_colors:
-                # Generate a hue from the category name hash for deterministic colors
-                hue = abs(hash(category)) % 360
+                # Generate a hue from a CRC of the category name; unlike hash(), which
+                # is salted per process, this gives the same color in every session
+                hue = zlib.crc32(str(category).encode('utf-8')) % 360
                 color = QColor.fromHsv(hue, 200, 255)
                 self.category_colors[category] = color.name()
+                r, g, b, _ = color.getRgb()
+                self.category_stylesheets[category] = (
+                    f"QLabel {{ border: 3px solid {color.name()}; background-color: rgba({r}, {g}, {b}, 60); }}"
+                )
+                self._category_brushes[category] = QBrush(color.lighter(150))
 
             label = format_category_label(category)
             item = QListWidgetItem(label)
             # store canonical category value for later lookup
             item.setData(Qt.UserRole, category)
             # Use a pale background based on category color for the list item
-            item.setBackground(QBrush(QColor(self.category_colors[category]).lighter(150)))
+            item.setBackground(self._category_brushes[category])
             self.category_list.addItem(item)
             # If there is an example already set for this category, and the category is currently selected, update preview
             if self.current_category and self.current_category == category:
                 example = self.category_examples.get(category)
                 if example and example.exists():
-                    pix = QPixmap(str(example))
-                    if not pix.isNull():
-                        scaled = pix.scaled(160, 160, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                    scaled = self._get_scaled_pixmap(example, 160)
+                    if not scaled.isNull():
                         self.category_example_label.setPixmap(scaled)
                         self.category_example_label.setVisible(True)
     
@@ -511,9 +904,10 @@ class ChipOrganizerApp(QMainWindow):
         # Initialize ontology if it doesn't exist
         if not self.ontology:
             self.ontology = {'categories': []}
+            self.invalidate_categories()
         
         # Get current categories list
-        categories = get_categories_from_ontology(self.ontology)
+        categories = self.categories
         
         # Show the add label dialog
         dialog = AddLabelDialog(self)
@@ -534,9 +928,11 @@ class ChipOrganizerApp(QMainWindow):
             self.ontology['categories'].extend(result['added'])
         elif isinstance(self.ontology, list):
             self.ontology.extend(result['added'])
+        self.invalidate_categories()
         
         # Update the display
         if result['added']:
+            self._write_session_categories()
             self.update_category_list()
         
         # Show results
@@ -573,7 +969,7 @@ class ChipOrganizerApp(QMainWindow):
     def remove_label(self):
         """Remove labels via a multi-selection dialog."""
         # Get current categories
-        categories = get_categories_from_ontology(self.ontology)
+        categories = self.categories
         
         if not categories:
             QMessageBox.warning(
@@ -614,9 +1010,13 @@ class ChipOrganizerApp(QMainWindow):
         # Remove labels from ontology
         if isinstance(self.ontology, dict):
             if 'categories' in self.ontology:
-                for label in labels_to_remove:
-                    if label in self.ontology['categories']:
-                        self.ontology['categories'].remove(label)
+                to_remove = set(labels_to_remove)
+                self.ontology['categories'] = [
+                    category for category in self.ontology['categories']
+                    if category not in to_remove
+                ]
+        self.invalidate_categories()
+        self._write_session_categories()
         
         # Update the display
         self.update_category_list()
@@ -644,28 +1044,16 @@ class ChipOrganizerApp(QMainWindow):
             return
         
         try:
-            # Get categories
-            categories = []
-            if isinstance(self.ontology, dict):
-                if 'categories' in self.ontology:
-                    categories = self.ontology['categories']
-                elif 'classes' in self.ontology:
-                    categories = list(self.ontology['classes'].keys())
-                else:
-                    categories = list(self.ontology.keys())
-            elif isinstance(self.ontology, list):
-                categories = self.ontology
+            categories = self.categories
             
-            # Write to CSV
+            # Build the whole file in memory and write it in one call
+            header = (
+                "# Exported Labels from Chip Organizer\n"
+                f"# Total labels: {len(categories)}\n\n"
+            )
+            body = "".join(f"{format_category_label(category)}\n" for category in categories)
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write("# Exported Labels from Chip Organizer\n")
-                f.write(f"# Total labels: {len(categories)}\n\n")
-                for category in categories:
-                    if isinstance(category, dict):
-                        label = category.get('label', category.get('name', str(category)))
-                    else:
-                        label = str(category)
-                    f.write(f"{label}\n")
+                f.write(header + body)
             
             QMessageBox.information(
                 self, "Export Successful",
@@ -689,21 +1077,16 @@ class ChipOrganizerApp(QMainWindow):
 
         # Update current classification display
         self.current_classification_label.setText(f"Selected Category: {format_category_label(self.current_category)}")
-        self.current_classification_label.setStyleSheet(
-            "QLabel { padding: 10px; background-color: #cce5ff; border: 2px solid #007bff; font-weight: bold; }"
-        )
+        self.set_widget_state(self.current_classification_label, "selected", True)
         
         # Update status to guide user
         self.status_indicator.setText(f"Ready to label | Click images to mark as '{self.current_category}'")
-        self.status_indicator.setStyleSheet(
-            "QLabel { padding: 8px; font-weight: bold; background-color: #cce5ff; border: 2px solid #007bff; border-radius: 4px; }"
-        )
+        self.set_widget_state(self.status_indicator, "state", "ready")
         # Show category example if present
         example = self.category_examples.get(self.current_category)
         if example and example.exists():
-            pix = QPixmap(str(example))
-            if not pix.isNull():
-                scaled = pix.scaled(160, 160, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            scaled = self._get_scaled_pixmap(example, 160)
+            if not scaled.isNull():
                 self.category_example_label.setPixmap(scaled)
                 self.category_example_label.setVisible(True)
         else:
@@ -719,11 +1102,11 @@ class ChipOrganizerApp(QMainWindow):
             return
 
         self.category_examples[category] = image_path
+        self._write_session_categories()
         # Update preview if currently selected
         if self.current_category == category:
-            pix = QPixmap(str(image_path))
-            if not pix.isNull():
-                scaled = pix.scaled(160, 160, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            scaled = self._get_scaled_pixmap(image_path, 160)
+            if not scaled.isNull():
                 self.category_example_label.setPixmap(scaled)
                 self.category_example_label.setVisible(True)
 
@@ -746,8 +1129,7 @@ class ChipOrganizerApp(QMainWindow):
             self.status_indicator.setText("Set example cancelled.")
             return
 
-        # Get categories
-        categories = get_categories_from_ontology(self.ontology)
+        categories = self.categories
         if not categories:
             QMessageBox.warning(self, "No Categories", "No categories available. Load or create labels first.")
             return
@@ -846,98 +1228,229 @@ class ChipOrganizerApp(QMainWindow):
         if self.image_files:
             self.display_grid()
     
-    def display_grid(self):
-        """Display images in grid layout."""
-        # Clear existing grid
-        for i in reversed(range(self.grid_layout.count())):
-            self.grid_layout.itemAt(i).widget().setParent(None)
+    def _cache_scaled_pixmap(self, key: Tuple[str, int], pixmap: QPixmap):
+        """Store a scaled pixmap, evicting the least recently used entries if full.
         
-        self.grid_labels.clear()
+        The cache holds the current and the prefetched next grid page plus
+        SCALED_PIXMAP_CACHE_SIZE more, so large grids don't evict their own page.
+        """
+        self._scaled_pixmaps[key] = pixmap
+        self._scaled_pixmaps.move_to_end(key)
+        cols, rows = self.grid_size
+        capacity = 2 * cols * rows + SCALED_PIXMAP_CACHE_SIZE
+        while len(self._scaled_pixmaps) > capacity:
+            self._scaled_pixmaps.popitem(last=False)
+    
+    def _cached_scaled_pixmap(self, image_path: Path, size: int) -> Optional[QPixmap]:
+        """Return the cached scaled pixmap for an image, or None if it isn't cached."""
+        key = (str(image_path), size)
+        scaled = self._scaled_pixmaps.get(key)
+        if scaled is not None:
+            self._scaled_pixmaps.move_to_end(key)
+        return scaled
+    
+    def _get_scaled_pixmap(self, image_path: Path, size: int, smooth: bool = True) -> QPixmap:
+        """Return an image scaled to fit a size x size box, reusing cached results.
         
-        if not self.image_files:
-            return
+        With smooth=False a cache miss produces a quick preview that is not
+        cached; callers are expected to request the smooth version later.
+        """
+        scaled = self._cached_scaled_pixmap(image_path, size)
+        if scaled is not None:
+            return scaled
+        
+        scaled = QPixmap.fromImage(load_thumbnail(str(image_path), size, self._thumbnail_dir, smooth))
+        if smooth and not scaled.isNull():
+            self._cache_scaled_pixmap((str(image_path), size), scaled)
+        return scaled
+    
+    def _placeholder_pixmap(self, size: int) -> QPixmap:
+        """Return the loading placeholder for a thumbnail size, shared by all grid cells."""
+        if self._placeholder is None or self._placeholder.width() != size:
+            self._placeholder = QPixmap(size, size)
+            self._placeholder.fill(QColor(*COLOR_PLACEHOLDER))
+        return self._placeholder
+    
+    def _prefetch_images(self, image_paths: List[Path], size: int):
+        """Decode scaled images in the background and store them in the pixmap cache.
         
-        cols, rows = self.grid_size
-        images_per_page = cols * rows
+        Any that are on the grid when they arrive are shown there. Each call
+        replaces the previous request, so rapid cycling or zooming only decodes
+        the latest page.
+        """
+        self._pending_loads = list(image_paths)
+        self._pending_load_size = size
+        self._start_pending_loads()
+    
+    def _start_pending_loads(self):
+        """Hand pending decodes to idle workers, grid cells in view first.
         
-        # Get unlabeled images starting from grid_start_index
-        unlabeled_images = [
-            img for img in self.image_files
-            if img.name not in self.classifications
-        ]
+        Picking happens each time a worker frees up, so after scrolling the
+        newly visible cells are decoded before the ones scrolled out of view;
+        otherwise images keep the order they were requested in.
+        """
+        free_workers = self._prefetch_pool.maxThreadCount() - len(self._prefetch_in_flight)
+        if free_workers <= 0 or not self._pending_loads:
+            return
         
-        if not unlabeled_images:
-            self.status_indicator.setText("All images labeled!")
-            self.status_indicator.setStyleSheet(
-                "QLabel { padding: 8px; font-weight: bold; background-color: #90EE90; border: 2px solid #4CAF50; border-radius: 4px; }"
-            )
+        visible = {
+            image_path for widget, image_path in self.grid_labels.items()
+            if not widget.visibleRegion().isEmpty()
+        }
+        self._pending_loads.sort(key=lambda image_path: image_path not in visible)
+        
+        while free_workers > 0 and self._pending_loads:
+            key = (str(self._pending_loads.pop(0)), self._pending_load_size)
+            if key in self._prefetch_in_flight or key in self._scaled_pixmaps:
+                continue
+            self._prefetch_in_flight.add(key)
+            loader = PixmapLoader(*key, self._thumbnail_dir)
+            loader.signals.loaded.connect(self._on_prefetch_loaded)
+            self._prefetch_pool.start(loader)
+            free_workers -= 1
+    
+    def _on_prefetch_loaded(self, image_path: str, size: int, image: QImage):
+        """Cache a background-decoded image and show it if it is on the grid (main thread)."""
+        key = (image_path, size)
+        self._prefetch_in_flight.discard(key)
+        self._start_pending_loads()
+        if image.isNull():
             return
+        pixmap = self._scaled_pixmaps.get(key)
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(image)
+            self._cache_scaled_pixmap(key, pixmap)
         
-        # Display images in grid
-        for idx in range(images_per_page):
-            row = idx // cols
-            col = idx % cols
-            
-            img_idx = self.grid_start_index + idx
-            if img_idx >= len(unlabeled_images):
-                break
-            
-            image_path = unlabeled_images[img_idx]
-            
-            # Calculate sizes based on zoom level
-            base_size = 180
-            zoomed_size = int(base_size * self.zoom_level)
-            
-            # Create clickable image label
-            img_widget = ClickableImageLabel(image_path, self)
-            
-            # Apply zoom to widget size constraints
-            img_widget.setMinimumSize(int(150 * self.zoom_level), int(150 * self.zoom_level))
-            img_widget.setMaximumSize(int(200 * self.zoom_level), int(200 * self.zoom_level))
-            
-            # Check if already labeled and set assigned_category for correct border color
-            if image_path.name in self.classifications:
-                img_widget.assigned_category = self.classifications[image_path.name]
-                img_widget.set_labeled(True)
-            else:
-                img_widget.assigned_category = None
-            
-            # Load and display image
-            pixmap = QPixmap(str(image_path))
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(zoomed_size, zoomed_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                img_widget.setPixmap(scaled_pixmap)
+        # Results for an earlier zoom level or a page no longer shown are only cached
+        if size != int(180 * self.zoom_level):
+            return
+        for widget, shown_path in self.grid_labels.items():
+            if str(shown_path) == image_path:
+                widget.setPixmap(pixmap)
+    
+    def _build_grid_cells(self):
+        """Replace the pooled grid cells with one per slot of the current grid size."""
+        for i in reversed(range(self.grid_layout.count())):
+            self.grid_layout.itemAt(i).widget().setParent(None)
+        self.grid_labels.clear()
+        self._grid_cells = []
+        
+        cols, rows = self.grid_size
+        for idx in range(cols * rows):
+            img_widget = ClickableImageLabel(None, self)
             
             # Add filename label below image
             container = QWidget()
             container_layout = QVBoxLayout(container)
             container_layout.addWidget(img_widget)
             
-            filename_label = QLabel(image_path.name)
+            filename_label = QLabel()
             filename_label.setAlignment(Qt.AlignCenter)
             filename_label.setWordWrap(True)
-            filename_label.setMaximumWidth(int(200 * self.zoom_level))
-            font_size = max(8, int(10 * self.zoom_level))  # Scale font but keep minimum readable
-            filename_label.setStyleSheet(f"QLabel {{ font-size: {font_size}px; }}")
             container_layout.addWidget(filename_label)
             
             # Attach filename label and container to widget for easy updates when cycling
             img_widget.filename_label = filename_label
             img_widget.container = container
-
-            self.grid_layout.addWidget(container, row, col)
+            
+            self.grid_layout.addWidget(container, idx // cols, idx % cols)
+            self._grid_cells.append(img_widget)
+        
+        self._grid_cells_size = self.grid_size
+        self._grid_cells_zoom = None
+    
+    def _apply_grid_zoom(self):
+        """Resize the pooled grid cells for the current zoom level."""
+        min_size = int(150 * self.zoom_level)
+        max_size = int(200 * self.zoom_level)
+        # Scale font but keep minimum readable; one shared font instead of a style sheet per label
+        filename_font = QFont(self.font())
+        filename_font.setPixelSize(max(8, int(10 * self.zoom_level)))
+        for img_widget in self._grid_cells:
+            img_widget.setMinimumSize(min_size, min_size)
+            img_widget.setMaximumSize(max_size, max_size)
+            img_widget.filename_label.setMaximumWidth(max_size)
+            img_widget.filename_label.setFont(filename_font)
+        self._grid_cells_zoom = self.zoom_level
+    
+    def display_grid(self):
+        """Display images in grid layout."""
+        # Repaint the grid once after all cells are updated
+        self.grid_container.setUpdatesEnabled(False)
+        
+        # Grid cells are reused across redraws; only their contents change
+        if self._grid_cells_size != self.grid_size:
+            self._build_grid_cells()
+        if self._grid_cells_zoom != self.zoom_level:
+            self._apply_grid_zoom()
+        
+        self.grid_labels.clear()
+        
+        cols, rows = self.grid_size
+        images_per_page = cols * rows
+        
+        # Get unlabeled images starting from grid_start_index; the filter stops
+        # after this page and the next (for prefetching) instead of scanning every image
+        unlabeled_images = (
+            img for img in self.image_files
+            if img.name not in self.classifications
+        )
+        upcoming_images = list(islice(
+            unlabeled_images, self.grid_start_index, self.grid_start_index + 2 * images_per_page
+        ))
+        page_images = upcoming_images[:images_per_page]
+        
+        # Calculate sizes based on zoom level
+        base_size = 180
+        zoomed_size = int(base_size * self.zoom_level)
+        
+        # Display images in grid, hiding the cells past the end of the page.
+        # Cached thumbnails are shown immediately; the rest are decoded in the
+        # background, starting as a placeholder (or, when zooming, as a quick
+        # stretch of the thumbnail the cell already shows)
+        pending_images = []
+        for idx, img_widget in enumerate(self._grid_cells):
+            if idx >= len(page_images):
+                img_widget.container.hide()
+                continue
+            
+            image_path = page_images[idx]
+            scaled_pixmap = self._cached_scaled_pixmap(image_path, zoomed_size)
+            if scaled_pixmap is None:
+                pending_images.append(image_path)
+                shown_pixmap = img_widget.pixmap()
+                if img_widget.image_path == image_path and shown_pixmap is not None and not shown_pixmap.isNull():
+                    scaled_pixmap = shown_pixmap.scaled(
+                        zoomed_size, zoomed_size, Qt.KeepAspectRatio, Qt.FastTransformation
+                    )
+                else:
+                    scaled_pixmap = self._placeholder_pixmap(zoomed_size)
+            img_widget.rebind(image_path, scaled_pixmap, self.classifications.get(image_path.name))
+            img_widget.filename_label.setText(image_path.name)
+            img_widget.container.show()
             self.grid_labels[img_widget] = image_path
         
+        self.grid_container.setUpdatesEnabled(True)
+        
+        if not self.image_files:
+            return
+        
+        if not page_images and all(img.name in self.classifications for img in self.image_files):
+            self.status_indicator.setText("All images labeled!")
+            self.set_widget_state(self.status_indicator, "state", "complete")
+            return
+        
+        # Decode the missing thumbnails, then warm the cache with the page that follows
+        self._prefetch_images(pending_images + upcoming_images[images_per_page:], zoomed_size)
+        
         # Update status
         labeled_count = len(self.classifications)
         total_count = len(self.image_files)
-        showing = min(images_per_page, len(unlabeled_images) - self.grid_start_index)
+        showing = len(page_images)
         self.status_indicator.setText(
             f"Showing {showing} unlabeled images | Total: {labeled_count}/{total_count} labeled"
         )
-        self.status_indicator.setStyleSheet(
-            "QLabel { padding: 8px; font-weight: bold; background-color: #e0e0e0; border: 2px solid #999; border-radius: 4px; }"
-        )
+        self.set_widget_state(self.status_indicator, "state", "neutral")
     
     def on_image_clicked(self, image_widget):
         """Label image immediately when clicked."""
@@ -975,16 +1488,18 @@ class ChipOrganizerApp(QMainWindow):
         if not image_path:
             return
         
+        # Re-clicking an image with the category it already has changes nothing
+        if self.classifications.get(image_path.name) == self.current_category:
+            return
+        
         # Label the image
-        self.classifications[image_path.name] = self.current_category
+        self.set_classification(image_path.name, self.current_category)
         # annotate widget so its border can reflect category color
         image_widget.assigned_category = self.current_category
         image_widget.set_labeled(True)
         
         # Update all displays
-        self.update_file_list()
-        self.update_statistics()
-        self.update_ui_state()
+        self._schedule_refresh(image_path.name)
         
         # Update status
         labeled_count = len(self.classifications)
@@ -992,9 +1507,7 @@ class ChipOrganizerApp(QMainWindow):
         self.status_indicator.setText(
             f"✓ Labeled as '{self.current_category}' | Total: {labeled_count}/{total_count} labeled"
         )
-        self.status_indicator.setStyleSheet(
-            "QLabel { padding: 8px; font-weight: bold; color: white; background-color: #28a745; border: 2px solid #1e7e34; border-radius: 4px; }"
-        )
+        self.set_widget_state(self.status_indicator, "state", "labeled")
 
     def on_image_right_clicked(self, image_widget):
         """Unassign label from an image when right-clicked.
@@ -1007,26 +1520,20 @@ class ChipOrganizerApp(QMainWindow):
 
         # If the image is classified, remove the classification
         if image_path.name in self.classifications:
-            old_cat = self.classifications.pop(image_path.name)
+            old_cat = self.remove_classification(image_path.name)
             image_widget.assigned_category = None
             image_widget.set_labeled(False)
 
             # Update UI state
-            self.update_file_list()
-            self.update_statistics()
-            self.update_ui_state()
+            self._schedule_refresh(image_path.name)
 
             # Update status indicator
             self.status_indicator.setText(f"Removed label '{format_category_label(old_cat)}' from {image_path.name}")
-            self.status_indicator.setStyleSheet(
-                "QLabel { padding: 8px; font-weight: bold; background-color: #ffc107; border: 2px solid #ff9800; border-radius: 4px; }"
-            )
+            self.set_widget_state(self.status_indicator, "state", "removed")
         else:
             # No-op if image wasn't labeled; provide subtle feedback
             self.status_indicator.setText("Image not labeled")
-            self.status_indicator.setStyleSheet(
-                "QLabel { padding: 8px; font-weight: bold; background-color: #e0e0e0; border: 2px solid #999; border-radius: 4px; }"
-            )
+            self.set_widget_state(self.status_indicator, "state", "neutral")
     
     def cycle_labeled_images(self):
         """Cycle the entire grid to the next alphabetical batch of unlabeled images.
@@ -1037,10 +1544,16 @@ class ChipOrganizerApp(QMainWindow):
             return
 
         # Remove already labeled images from the master list so they don't show again
-        self.image_files = [img for img in self.image_files if img.name not in self.classifications]
+        labeled_files = [img.name for img in self.image_files if img.name in self.classifications]
+        if labeled_files:
+            self.image_files = tuple(img for img in self.image_files if img.name not in self.classifications)
 
-        # Build an alphabetical list of remaining (unlabeled) images
-        unlabeled_images = sorted(self.image_files, key=lambda p: p.name.lower())
+        # Build an alphabetical list of remaining (unlabeled) images; the order is
+        # sorted once and then only filtered, which keeps it sorted
+        if self._cycle_order is None:
+            self._cycle_order = sorted(self.image_files, key=lambda p: p.name.lower())
+        unlabeled_images = [img for img in self._cycle_order if img.name not in self.classifications]
+        self._cycle_order = unlabeled_images
 
         if not unlabeled_images:
             QMessageBox.information(self, "All Labeled", "All images have been labeled.")
@@ -1070,19 +1583,24 @@ class ChipOrganizerApp(QMainWindow):
                 page_images = unlabeled_images[start:]
                 page_images.extend(unlabeled_images[0:wrap_count])
 
-        # Iterate current grid widgets and set them to the page images (or clear if none)
+        # Iterate current grid widgets and set them to the page images (or clear if none),
+        # repainting the grid once at the end
+        self.grid_container.setUpdatesEnabled(False)
+        zoomed_size = int(180 * getattr(self, 'zoom_level', 1.0))
+        pending_images = []
         widgets = list(self.grid_labels.keys())
         for i, widget in enumerate(widgets):
             if i < len(page_images):
                 new_image = page_images[i]
                 self.grid_labels[widget] = new_image
-                pixmap = QPixmap(str(new_image))
-                if not pixmap.isNull():
-                    # Respect zoom level when rendering
-                    zoomed_size = int(180 * getattr(self, 'zoom_level', 1.0))
-                    widget.setPixmap(pixmap.scaled(zoomed_size, zoomed_size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                widget.assigned_category = None
-                widget.set_labeled(False)
+                # Respect zoom level when rendering; uncached images get a quick
+                # preview so holding Space stays responsive, and the smooth
+                # version replaces it once decoded in the background
+                pixmap = self._cached_scaled_pixmap(new_image, zoomed_size)
+                if pixmap is None:
+                    pixmap = self._get_scaled_pixmap(new_image, zoomed_size, smooth=False)
+                    pending_images.append(new_image)
+                widget.rebind(new_image, pixmap)
                 if hasattr(widget, 'filename_label'):
                     widget.filename_label.setText(new_image.name)
             else:
@@ -1094,6 +1612,7 @@ class ChipOrganizerApp(QMainWindow):
                     widget.filename_label.setText("")
                 if widget in self.grid_labels:
                     del self.grid_labels[widget]
+        self.grid_container.setUpdatesEnabled(True)
 
         # Advance page (wrap if needed when there are >= page sized images)
         if len(unlabeled_images) >= images_per_page:
@@ -1102,15 +1621,51 @@ class ChipOrganizerApp(QMainWindow):
             # keep at 0 when fewer than one page remains
             self.grid_start_index = 0
 
+        # Decode smooth versions of the quick previews, then warm the cache with
+        # the page the next cycle will show
+        if len(unlabeled_images) > images_per_page:
+            next_start = self.grid_start_index
+            pending_images.extend(unlabeled_images[next_start:next_start + images_per_page])
+        self._prefetch_images(pending_images, zoomed_size)
+
         # Update UI
-        self.update_file_list()
-        self.update_statistics()
-        self.update_ui_state()
+        self._schedule_refresh(removed_files=labeled_files)
 
         total_unlabeled = len(unlabeled_images)
         shown_count = len(page_images)
         self.status_indicator.setText(f"Showing {shown_count} of {total_unlabeled} unlabeled images (page start {start + 1})")
     
+    def set_classification(self, filename: str, category: str):
+        """Label a file, keeping the per-category counts in step."""
+        category = sys.intern(category)
+        previous = self.classifications.get(filename)
+        if previous is not None:
+            self._uncount_category(previous)
+        self.classifications[filename] = category
+        self._category_counts[category] = self._category_counts.get(category, 0) + 1
+        # set_label replaces any previous label, so relabeling is a single write
+        self._write_session(SessionStore.set_label, filename, category)
+    
+    def remove_classification(self, filename: str) -> Optional[str]:
+        """Unlabel a file and return its previous category (None if it had none)."""
+        category = self.classifications.pop(filename, None)
+        if category is not None:
+            self._uncount_category(category)
+            self._write_session(SessionStore.remove_label, filename)
+        return category
+    
+    def _uncount_category(self, category: str):
+        """Decrement a category's count, dropping it once no file uses it."""
+        remaining = self._category_counts[category] - 1
+        if remaining:
+            self._category_counts[category] = remaining
+        else:
+            del self._category_counts[category]
+    
+    def _rebuild_category_counts(self):
+        """Recount classifications per category after a bulk replacement."""
+        self._category_counts = Counter(self.classifications.values())
+    
     def update_statistics(self):
         """Update the statistics display."""
         if not self.image_files:
@@ -1121,21 +1676,20 @@ class ChipOrganizerApp(QMainWindow):
         classified = len(self.classifications)
         remaining = total - classified
         
-        # Count by category
-        category_counts = {}
-        for category in self.classifications.values():
-            category_counts[category] = category_counts.get(category, 0) + 1
+        category_counts = self._category_counts
         
-        stats_text = f"Total Images: {total}\n"
-        stats_text += f"Classified: {classified}\n"
-        stats_text += f"Remaining: {remaining}\n\n"
+        lines = [
+            f"Total Images: {total}",
+            f"Classified: {classified}",
+            f"Remaining: {remaining}",
+            "",
+        ]
         
         if category_counts:
-            stats_text += "By Category:\n"
-            for category, count in sorted(category_counts.items()):
-                stats_text += f"  {category}: {count}\n"
+            lines.append("By Category:")
+            lines.extend(f"  {category}: {count}" for category, count in sorted(category_counts.items()))
         
-        self.stats_label.setText(stats_text)
+        self.stats_label.setText("\n".join(lines) + "\n")
     
     def save_progress(self):
         """Save current progress to a JSON file."""
@@ -1153,14 +1707,16 @@ class ChipOrganizerApp(QMainWindow):
         try:
             progress_data = {
                 'source_directory': str(self.source_directory),
+                'source_mtime_ns': self._source_mtime_ns,
+                'image_files': [image_file.name for image_file in self._source_files],
                 'current_index': self.current_index,
                 'classifications': self.classifications,
                 'ontology': self.ontology,
                 'category_examples': {k: str(v) for k, v in self.category_examples.items()}
             }
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(progress_data, f, indent=2)
+            with open(filename, 'wb') as f:
+                f.write(dump_json(progress_data))
             
             QMessageBox.information(
                 self, "Progress Saved",
@@ -1182,20 +1738,36 @@ class ChipOrganizerApp(QMainWindow):
             return
         
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                progress_data = json.load(f)
+            with open(filename, 'rb') as f:
+                progress_data = load_json(f.read())
             
             # Restore state
             self.source_directory = Path(progress_data['source_directory'])
             self.current_index = progress_data.get('current_index', 0)
-            self.classifications = progress_data.get('classifications', {})
+            self.classifications = intern_categories(progress_data.get('classifications', {}))
+            self._rebuild_category_counts()
             self.ontology = progress_data.get('ontology', {})
+            self.invalidate_categories()
             # Load category example mappings if present
             examples = progress_data.get('category_examples', {})
             self.category_examples = {k: Path(v) for k, v in examples.items()} if examples else {}
             
-            # Reload images from source directory using utility function
-            self.image_files = find_image_files(self.source_directory, SUPPORTED_FORMATS)
+            # Reuse the saved (already sorted) file list while the directory is
+            # unchanged since it was scanned: adding, removing or renaming files
+            # bumps its mtime, and the names are checked too in case the
+            # filesystem doesn't keep directory mtimes up to date
+            saved_files = progress_data.get('image_files')
+            saved_mtime_ns = progress_data.get('source_mtime_ns')
+            if (saved_files is not None and saved_mtime_ns is not None
+                    and saved_mtime_ns == get_mtime_ns(self.source_directory)
+                    and image_names_match(self.source_directory, saved_files, SUPPORTED_FORMATS)):
+                self._source_mtime_ns = saved_mtime_ns
+                self._source_files = tuple(self.source_directory / name for name in saved_files)
+                self.image_files = self._source_files
+                self._cycle_order = None
+            else:
+                self.scan_source_directory()
+            self._replace_session_labels()
             
             # Update UI
             self.update_category_list()
@@ -1233,24 +1805,81 @@ class ChipOrganizerApp(QMainWindow):
         
         output_path = Path(output_dir)
         copy_mode = self.copy_mode_checkbox.isChecked()
-        operation = "copy" if copy_mode else "move"
+        hard_link = copy_mode and self.hard_link_checkbox.isChecked()
+        operation = "link" if hard_link else "copy" if copy_mode else "move"
         
         try:
-            # Create category directories and copy/move files
-            for filename, category in self.classifications.items():
-                # Create category directory
-                category_dir = output_path / category
+            # Pair each source file with its destination in the category directory
+            transfers = [
+                (self.source_directory / filename, output_path / category / filename)
+                for filename, category in self.classifications.items()
+            ]
+            
+            # Create each category directory once up front
+            for category_dir in {dest_file.parent for _, dest_file in transfers}:
                 category_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Find source file
-                source_file = self.source_directory / filename
-                dest_file = category_dir / filename
-                
-                # Copy or move file
-                if copy_mode:
-                    shutil.copy2(source_file, dest_file)
-                else:
-                    shutil.move(str(source_file), str(dest_file))
+            
+            # Copy or move files concurrently; disk I/O overlaps across workers
+            if hard_link:
+                transfer = link_or_copy
+            else:
+                transfer = shutil.copy2 if copy_mode else move_file
+            max_workers = min(EXPORT_MAX_WORKERS, (os.cpu_count() or 1) * 2)
+            failures = []
+            completed = 0
+            canceled = False
+            
+            progress = QProgressDialog(
+                f"Exporting images ({operation})...", "Cancel", 0, len(transfers), self
+            )
+            progress.setWindowTitle("Exporting")
+            progress.setWindowModality(Qt.WindowModal)
+            progress.setMinimumDuration(500)
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(transfer, str(source_file), str(dest_file)): source_file
+                    for source_file, dest_file in transfers
+                }
+                pending = set(futures)
+                while pending:
+                    # Poll with a short timeout so the dialog and its Cancel button
+                    # keep responding while a single slow transfer is running
+                    done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if future.cancelled():
+                            continue
+                        try:
+                            future.result()
+                        except Exception as e:
+                            failures.append(f"{futures[future].name}: {str(e)}")
+                        completed += 1
+                    if not canceled:
+                        progress.setValue(completed)
+                    QApplication.processEvents()
+                    if not canceled and progress.wasCanceled():
+                        canceled = True
+                        # Drop queued transfers and keep polling until the running ones finish
+                        for future in pending:
+                            future.cancel()
+            progress.close()
+            
+            if canceled:
+                QMessageBox.warning(
+                    self, "Export Canceled",
+                    f"Export canceled after {completed} of {len(transfers)} images."
+                )
+                return
+            
+            if failures:
+                details = "\n".join(failures[:10])
+                if len(failures) > 10:
+                    details += f"\n... and {len(failures) - 10} more"
+                QMessageBox.critical(
+                    self, "Export Error",
+                    f"Failed to {operation} {len(failures)} of {len(transfers)} images:\n{details}"
+                )
+                return
             
             QMessageBox.information(
                 self, "Export Complete",
@@ -1283,6 +1912,21 @@ class ChipOrganizerApp(QMainWindow):
         self.zoom_level_label.setText(f"{int(self.zoom_level * 100)}%")
         
         # Redisplay the grid with new zoom level
+        self._schedule_redisplay()
+    
+    def _schedule_redisplay(self):
+        """Redisplay the grid on the next event-loop turn.
+        
+        Holding a zoom shortcut then redraws the grid once for the final
+        zoom level instead of once per step.
+        """
+        if not self._redisplay_pending:
+            self._redisplay_pending = True
+            QTimer.singleShot(0, self._do_redisplay)
+    
+    def _do_redisplay(self):
+        """Apply a redisplay queued by _schedule_redisplay."""
+        self._redisplay_pending = False
         self.display_grid()
     
     def update_ui_state(self):
@@ -1294,10 +1938,72 @@ class ChipOrganizerApp(QMainWindow):
         self.export_btn.setEnabled(bool(self.classifications))
         self.cycle_labeled_btn.setEnabled(has_images)
     
+    def _write_session(self, write, *args):
+        """Apply a write to the session store, dropping the store if it fails."""
+        if self.session_store is None or self.source_directory is None:
+            return
+        try:
+            write(self.session_store, self.source_directory, *args)
+        except sqlite3.Error:
+            self.session_store = None
+    
+    def _write_session_categories(self):
+        """Record the current ontology and category examples in the session store."""
+        examples = {category: str(path) for category, path in self.category_examples.items()}
+        self._write_session(SessionStore.set_categories, self.ontology, examples)
+    
+    def _replace_session_labels(self):
+        """Make the session store match the current directory, classifications and ontology."""
+        self._write_session(SessionStore.replace_labels, self.classifications)
+        self._write_session_categories()
+        if self.source_directory is not None:
+            self.settings.setValue("last_source_directory", str(self.source_directory))
+    
     def restore_session(self):
-        """Restore the last session if available."""
-        # This could auto-load the last progress file or directory
-        pass
+        """Restore the last session (images, labels and ontology) if available."""
+        last_directory = self.settings.value("last_source_directory", "")
+        if (self.session_store is None or self.source_directory is not None
+                or not last_directory or not os.path.isdir(last_directory)):
+            return
+        
+        source_directory = Path(last_directory)
+        try:
+            categories = self.session_store.load_categories(source_directory)
+            classifications = self.session_store.load_labels(source_directory)
+        except sqlite3.Error:
+            return
+        # Without the ontology the restored labels could not be extended, so
+        # only whole sessions are restored
+        if categories is None:
+            return
+        
+        self.source_directory = source_directory
+        self.scan_source_directory()
+        if not self.image_files:
+            self.source_directory = None
+            return
+        
+        self.ontology, examples = categories
+        self.invalidate_categories()
+        self.category_examples = {k: Path(v) for k, v in examples.items()}
+        self.classifications = intern_categories(classifications)
+        self._rebuild_category_counts()
+        self.grid_start_index = 0
+        
+        self.update_category_list()
+        self.display_grid()
+        self.update_statistics()
+        self.update_ui_state()
+        self.update_file_list()
+    
+    def closeEvent(self, event):
+        """Stop background thumbnail decoding and close the session store before the window goes away."""
+        self._pending_loads.clear()
+        self._prefetch_pool.waitForDone()
+        if self.session_store is not None:
+            self.session_store.close()
+            self.session_store = None
+        super().closeEvent(event)
     
     def resizeEvent(self, event):
         """Handle window resize events."""
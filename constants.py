@@ -18,9 +18,21 @@ FILE_LIST_MAX_WIDTH = 250
 COLOR_LABELED = (144, 238, 144)  # Light green for labeled images
 COLOR_UNLABELED = (255, 182, 193)  # Light pink for unlabeled images
 COLOR_CURRENT = (173, 216, 230)  # Light blue for current image
+COLOR_PLACEHOLDER = (240, 240, 240)  # Light gray for thumbnails still loading
+
+# Image caching
+SCALED_PIXMAP_CACHE_SIZE = 128  # Scaled thumbnails kept in memory beyond two grid pages
+THUMBNAIL_CACHE_SIZE = 256  # Edge length of thumbnails cached on disk
+THUMBNAIL_CACHE_DIRNAME = "thumbnails"  # Subdirectory of the app cache location
+THUMBNAIL_CACHE_MAX_BYTES = 512 * 1024 * 1024  # Least recently used thumbnails are pruned above this
+THUMBNAIL_TEMP_MAX_AGE_SECONDS = 60 * 60  # Older temporary thumbnail files are leftovers and deleted
+
+# Export
+EXPORT_MAX_WORKERS = 16  # Upper bound on concurrent copy/move operations
 
 # Progress file
 DEFAULT_PROGRESS_FILENAME = "chip_organizer_progress.json"
+SESSION_DB_FILENAME = "session.db"  # Label journal used to restore the last session
 
 # CSV Export
 CSV_HEADER = ["label", "parent", "description"]
@@ -0,0 +1,101 @@
+"""
+Incremental session storage for the Chip Organizer application.
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+class SessionStore:
+    """Journal of label assignments, written one change at a time.
+
+    Backed by SQLite in WAL mode, so labeling an image costs a single small
+    write instead of re-serializing every classification.
+    """
+
+    def __init__(self, db_path: Path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(db_path))
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode this only syncs at checkpoints; a power loss may drop the
+        # last few label changes but cannot corrupt the database
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS labels ("
+            " source_directory TEXT NOT NULL,"
+            " filename TEXT NOT NULL,"
+            " category TEXT NOT NULL,"
+            " updated REAL NOT NULL,"
+            " PRIMARY KEY (source_directory, filename))"
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS categories ("
+            " source_directory TEXT PRIMARY KEY,"
+            " ontology TEXT NOT NULL,"
+            " category_examples TEXT NOT NULL,"
+            " updated REAL NOT NULL)"
+        )
+        self.connection.commit()
+
+    def set_label(self, source_directory: Path, filename: str, category: str):
+        """Record the category assigned to a file (replacing any previous one)."""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO labels VALUES (?, ?, ?, ?)",
+                (str(source_directory), filename, category, time.time())
+            )
+
+    def remove_label(self, source_directory: Path, filename: str):
+        """Forget the category assigned to a file."""
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM labels WHERE source_directory = ? AND filename = ?",
+                (str(source_directory), filename)
+            )
+
+    def replace_labels(self, source_directory: Path, classifications: Dict[str, str]):
+        """Replace all recorded labels for a directory (e.g. after loading progress)."""
+        now = time.time()
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM labels WHERE source_directory = ?", (str(source_directory),)
+            )
+            self.connection.executemany(
+                "INSERT INTO labels VALUES (?, ?, ?, ?)",
+                ((str(source_directory), filename, category, now)
+                 for filename, category in classifications.items())
+            )
+
+    def set_categories(self, source_directory: Path, ontology, category_examples: Dict[str, str]):
+        """Record the ontology and category example images used for a directory."""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO categories VALUES (?, ?, ?, ?)",
+                (str(source_directory), json.dumps(ontology),
+                 json.dumps(category_examples), time.time())
+            )
+
+    def load_categories(self, source_directory: Path) -> Optional[Tuple[object, Dict[str, str]]]:
+        """Return the recorded (ontology, category examples) for a directory, or None."""
+        row = self.connection.execute(
+            "SELECT ontology, category_examples FROM categories WHERE source_directory = ?",
+            (str(source_directory),)
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), json.loads(row[1])
+
+    def load_labels(self, source_directory: Path) -> Dict[str, str]:
+        """Return the recorded filename -> category mapping for a directory."""
+        rows = self.connection.execute(
+            "SELECT filename, category FROM labels WHERE source_directory = ?",
+            (str(source_directory),)
+        )
+        return dict(rows)
+
+    def close(self):
+        """Close the underlying database connection."""
+        self.connection.close()
@@ -65,33 +65,26 @@ def download_mnist_subset(output_dir='mnist_test_data', num_samples_per_digit=50
     
     print(f"\nExtracting {num_samples_per_digit} samples per digit...")
     
-    # Count how many of each digit we've saved
-    digit_counts = {i: 0 for i in range(10)}
+    # Pick the first samples of each digit up front so only the images
+    # being saved are visited
+    digit_counts = {}
     total_saved = 0
     
-    # Iterate through the dataset and save samples
-    for idx, (image, label) in enumerate(zip(images, labels)):
-        label = int(label)
+    for label in range(10):
+        indices = np.flatnonzero(labels == label)[:num_samples_per_digit]
+        digit_counts[label] = len(indices)
         
-        # Check if we need more samples of this digit
-        if digit_counts[label] < num_samples_per_digit:
+        for count, idx in enumerate(indices):
             # Convert to PIL Image
-            img = Image.fromarray(image, mode='L')
+            img = Image.fromarray(images[idx], mode='L')
             
             # Save with digit in filename
-            filename = f"digit_{label}_{digit_counts[label]:03d}.png"
-            filepath = output_path / filename
-            img.save(filepath)
+            filename = f"digit_{label}_{count:03d}.png"
+            img.save(output_path / filename)
             
-            digit_counts[label] += 1
             total_saved += 1
-            
             if total_saved % 50 == 0:
                 print(f"Saved {total_saved} images...")
-        
-        # Stop when we have enough of all digits
-        if all(count >= num_samples_per_digit for count in digit_counts.values()):
-            break
     
     print(f"\n✓ Successfully saved {total_saved} images to {output_dir}/")
     print("\nDistribution:")
@@ -2,8 +2,32 @@
 Utility functions for the Chip Organizer application.
 """
 
+import os
+import json
+import shutil
+import sys
+import threading
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional
+
+try:
+    import orjson  # Optional: much faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux ioctl that makes a file share another file's data blocks (a reflink)
+_FICLONE = 0x40049409
+
+
+def _has_extension(name: str, extensions: set) -> bool:
+    """Check a file name's (lower-cased) extension; like a "*.ext" glob, dotfiles match too."""
+    dot = name.rfind('.')
+    return dot >= 0 and name[dot:].lower() in extensions
 
 
 def find_image_files(directory: Path, supported_formats: List[str]) -> List[Path]:
@@ -15,16 +39,222 @@ def find_image_files(directory: Path, supported_formats: List[str]) -> List[Path
         supported_formats: List of file extensions (e.g., ['.png', '.jpg'])
     
     Returns:
-        Sorted list of image file paths (duplicates removed)
+        Sorted list of image file paths (empty if the directory doesn't exist)
+    """
+    # Single directory pass; extensions are matched case-insensitively
+    extensions = {ext.lower() for ext in supported_formats}
+    
+    try:
+        with os.scandir(directory) as entries:
+            image_files = [
+                Path(entry.path) for entry in entries
+                if _has_extension(entry.name, extensions) and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    
+    # Compare plain strings instead of Path objects; normcase keeps the
+    # case-insensitive ordering Path uses on Windows
+    image_files.sort(key=os.path.normcase)
+    return image_files
+
+
+def image_names_match(directory: Path, names: List[str], supported_formats: List[str]) -> bool:
+    """
+    Check that a saved list of image names still matches a directory's contents.
+    
+    Only the directory's names are listed (no per-file stat, Path objects or
+    sorting), so this is a cheap guard for filesystems that don't reliably
+    update directory mtimes, such as FAT/exFAT drives and some SMB shares.
+    
+    Args:
+        directory: Directory the names were listed from
+        names: Saved image file names
+        supported_formats: List of file extensions (e.g., ['.png', '.jpg'])
+    
+    Returns:
+        True if the directory holds exactly these images
+    """
+    extensions = {ext.lower() for ext in supported_formats}
+    try:
+        current = {
+            name for name in os.listdir(directory) if _has_extension(name, extensions)
+        }
+    except OSError:
+        return False
+    return current == set(names)
+
+
+def get_mtime_ns(path: Path) -> Optional[int]:
+    """
+    Get the modification time of a file or directory.
+    
+    Args:
+        path: Path to check
+    
+    Returns:
+        Modification time in nanoseconds, or None if the path doesn't exist
+    """
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def clone_file(source: str, destination: str) -> bool:
+    """
+    Create destination as a copy-on-write clone (reflink) of source.
+    
+    Cloning only shares the data blocks, so it is instant on filesystems that
+    support it (Btrfs, XFS) and no bytes are read or written.
+    
+    Args:
+        source: Path of the existing file
+        destination: Path to create (an existing file is never overwritten)
+    
+    Returns:
+        True if the file was cloned, False if it could not be
+    """
+    if fcntl is None or not sys.platform.startswith('linux'):
+        return False
+    try:
+        with open(source, 'rb') as src, open(destination, 'xb') as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            except OSError:
+                # Not supported by this filesystem (or across filesystems)
+                dst.close()
+                os.remove(destination)
+                return False
+    except OSError:
+        return False
+    return True
+
+
+def _replace_from_temporary(destination: str, create) -> bool:
     """
-    image_files_set: Set[Path] = set()
+    Create a file under a temporary name next to destination, then swap it in.
     
-    for ext in supported_formats:
-        # Search for both lowercase and uppercase extensions
-        image_files_set.update(directory.glob(f"*{ext}"))
-        image_files_set.update(directory.glob(f"*{ext.upper()}"))
+    Args:
+        destination: Path to create or replace
+        create: Callable taking the temporary path; returns False if it created nothing
     
-    return sorted(list(image_files_set))
+    Returns:
+        True if destination was replaced, False if create failed
+    """
+    temp_file = f"{destination}.{threading.get_ident()}.tmp"
+    try:
+        if not create(temp_file):
+            return False
+        os.replace(temp_file, destination)
+    except OSError:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        raise
+    return True
+
+
+def _link(source: str, destination: str) -> bool:
+    """os.link that reports missing hard-link support as False instead of raising."""
+    try:
+        os.link(source, destination)
+    except OSError:
+        return False
+    return True
+
+
+def _clone(source: str, destination: str) -> bool:
+    """clone_file that also copies the source's metadata, like shutil.copy2."""
+    if not clone_file(source, destination):
+        return False
+    shutil.copystat(source, destination)
+    return True
+
+
+def link_or_copy(source: str, destination: str) -> str:
+    """
+    Hard-link a file into place, cloning or copying it when a link is not possible.
+    
+    An existing destination is replaced, unless it already is the source
+    (as after an earlier export into the same folder), which counts as done.
+    
+    Args:
+        source: Path of the existing file
+        destination: Path to create or replace
+    
+    Returns:
+        The destination path
+    """
+    try:
+        os.link(source, destination)
+        return destination
+    except FileExistsError:
+        if os.path.samefile(source, destination):
+            return destination
+        # Link under a temporary name and swap it in over the existing file
+        if _replace_from_temporary(destination, lambda temp_file: _link(source, temp_file)):
+            return destination
+    except OSError:
+        # Different filesystem or no hard-link support
+        pass
+    
+    if not _replace_from_temporary(destination, lambda temp_file: _clone(source, temp_file)):
+        shutil.copy2(source, destination)
+    return destination
+
+
+def move_file(source: str, destination: str) -> str:
+    """
+    Move a file into place, renaming it when both paths share a filesystem.
+    
+    An existing destination is replaced on every platform, as shutil.move
+    does (and as copying with shutil.copy2 does).
+    
+    Args:
+        source: Path of the existing file
+        destination: File path to move to (replaced if it exists)
+    
+    Returns:
+        The destination path
+    """
+    try:
+        os.replace(source, destination)
+    except OSError:
+        # Different filesystem (or rename refused); copy and delete instead
+        shutil.move(source, destination)
+    return destination
+
+
+def dump_json(data) -> bytes:
+    """
+    Serialize data to indented UTF-8 JSON.
+    
+    Args:
+        data: JSON-compatible object
+    
+    Returns:
+        Encoded JSON bytes (uses orjson when available)
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def load_json(raw: bytes):
+    """
+    Parse JSON from raw bytes.
+    
+    Args:
+        raw: Encoded JSON document
+    
+    Returns:
+        Decoded object (uses orjson when available)
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def parse_labels_from_text(text: str, existing_categories: List[str]) -> dict:
@@ -42,7 +272,9 @@ def parse_labels_from_text(text: str, existing_categories: List[str]) -> dict:
             - 'skipped': List of duplicate labels within the input
     """
     lines = text.split('\n')
+    existing = set(existing_categories)
     added_labels = []
+    added = set()  # Mirrors added_labels for constant-time membership checks
     duplicate_labels = []
     skipped_labels = []
     
@@ -54,16 +286,17 @@ def parse_labels_from_text(text: str, existing_categories: List[str]) -> dict:
             continue
         
         # Check if already exists in ontology
-        if label in existing_categories:
+        if label in existing:
             duplicate_labels.append(label)
             continue
         
         # Check if already in the list to be added
-        if label in added_labels:
+        if label in added:
             skipped_labels.append(label)
             continue
         
         added_labels.append(label)
+        added.add(label)
     
     return {
         'added': added_labels,